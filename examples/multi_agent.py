@@ -1,4 +1,5 @@
 import pathlib
+from functools import partial
 
 import gym
 
@@ -6,6 +7,8 @@ from examples.argument_parser import default_argument_parser
 from smarts.core.agent import Agent
 from smarts.core.agent_interface import AgentInterface, AgentType
 from smarts.core.utils.episodes import episodes
+from smarts.env.hiway_env import HiWayEnv
+from smarts.env.wrappers.parallel_env import ParallelEnv
 from smarts.sstudio import build_scenario
 from smarts.zoo.agent_spec import AgentSpec
 
@@ -18,7 +21,7 @@ class KeepLaneAgent(Agent):
         return "keep_lane"
 
 
-def main(scenarios, headless, num_episodes, max_episode_steps=None):
+def main(scenarios, headless, num_episodes, max_episode_steps=None, num_env=1):
     agent_specs = {
         agent_id: AgentSpec(
             interface=AgentInterface.from_type(
@@ -29,6 +32,17 @@ def main(scenarios, headless, num_episodes, max_episode_steps=None):
         for agent_id in AGENT_IDS
     }
 
+    if num_env > 1:
+        run_parallel(scenarios, headless, agent_specs, num_episodes, num_env)
+        return
+
+    # The agents are built once and reused across episodes. Each agent is
+    # reset at the start of an episode to clear any per-episode state.
+    agents = {
+        agent_id: agent_spec.build_agent()
+        for agent_id, agent_spec in agent_specs.items()
+    }
+
     env = gym.make(
         "smarts.env:hiway-v0",
         scenarios=scenarios,
@@ -38,10 +52,8 @@ def main(scenarios, headless, num_episodes, max_episode_steps=None):
     )
 
     for episode in episodes(n=num_episodes):
-        agents = {
-            agent_id: agent_spec.build_agent()
-            for agent_id, agent_spec in agent_specs.items()
-        }
+        for agent in agents.values():
+            agent.reset()
         observations = env.reset()
         episode.record_scenario(env.scenario_log)
 
@@ -58,10 +70,110 @@ def main(scenarios, headless, num_episodes, max_episode_steps=None):
     env.close()
 
 
+def run_parallel(scenarios, headless, agent_specs, num_episodes, num_env):
+    """Steps `num_env` independent environments, each in its own process, so
+    that the simulations make use of multiple CPU cores. All environments are
+    reset together at the start of every episode.
+
+    The episode's step count is the total number of steps taken across all
+    environments that are still running, so the reported steps per second and
+    sim/wall ratio reflect the combined throughput of the environments.
+    """
+    # Unique `sim_name` is required by each HiWayEnv in order to be displayed
+    # in Envision.
+    env_constructors = [
+        partial(
+            HiWayEnv,
+            scenarios=scenarios,
+            agent_specs=agent_specs,
+            sim_name=f"multi-agent_{ind}",
+            headless=headless,
+            sumo_headless=True,
+        )
+        for ind in range(num_env)
+    ]
+    env = ParallelEnv(env_constructors=env_constructors, auto_reset=False)
+
+    # Each environment gets its own set of agents, built once and reused
+    # across episodes, so that per-episode agent state is never shared
+    # between concurrently running environments.
+    batched_agents = [
+        {
+            agent_id: agent_spec.build_agent()
+            for agent_id, agent_spec in agent_specs.items()
+        }
+        for _ in range(num_env)
+    ]
+
+    for episode in episodes(n=num_episodes):
+        for agents in batched_agents:
+            for agent in agents.values():
+                agent.reset()
+        batched_observations = env.reset()
+        episode.record_scenario(_merge_scenario_logs(env.get_attr("scenario_log")))
+        batched_dones = [{"__all__": False} for _ in range(num_env)]
+
+        while not all(dones["__all__"] for dones in batched_dones):
+            batched_actions = [
+                {
+                    agent_id: agents[agent_id].act(agent_obs)
+                    for agent_id, agent_obs in observations.items()
+                    if not dones.get(agent_id, False)
+                }
+                for agents, observations, dones in zip(
+                    batched_agents, batched_observations, batched_dones
+                )
+            ]
+
+            prev_batched_dones = batched_dones
+            (
+                batched_observations,
+                batched_rewards,
+                batched_dones,
+                batched_infos,
+            ) = env.step(batched_actions)
+
+            episode.steps += sum(
+                not prev_dones["__all__"] for prev_dones in prev_batched_dones
+            )
+            for ind, (prev_dones, dones, infos) in enumerate(
+                zip(prev_batched_dones, batched_dones, batched_infos)
+            ):
+                # Finished environments are still stepped, with empty actions,
+                # until every environment is done. Only the step on which an
+                # environment finishes carries its final scores.
+                if prev_dones["__all__"] or not dones["__all__"]:
+                    continue
+                for agent_id, info in infos.items():
+                    episode.scores[f"Env {ind}: {agent_id}"] = info["score"]
+
+    env.close()
+
+
+def _merge_scenario_logs(scenario_logs):
+    """Combines the scenario logs of the parallel environments into a single
+    log, listing each distinct scenario value once.
+    """
+    merged_log = {"fixed_timestep_sec": scenario_logs[0]["fixed_timestep_sec"]}
+    for key in ("scenario_map", "scenario_routes", "mission_hash"):
+        values = dict.fromkeys(scenario_log[key] for scenario_log in scenario_logs)
+        merged_log[key] = ", ".join(values)
+    return merged_log
+
+
 if __name__ == "__main__":
     parser = default_argument_parser("multi-agent-example")
+    parser.add_argument(
+        "--num-env",
+        default=1,
+        type=int,
+        help="Number of environments to simulate in parallel processes.",
+    )
     args = parser.parse_args()
 
+    if args.num_env < 1:
+        parser.error(f"--num-env must be at least 1, but got {args.num_env}.")
+
     if not args.scenarios:
         args.scenarios = [
             str(pathlib.Path(__file__).absolute().parents[1] / "scenarios" / "loop")
@@ -73,4 +185,5 @@ if __name__ == "__main__":
         scenarios=args.scenarios,
         headless=args.headless,
         num_episodes=args.episodes,
+        num_env=args.num_env,
     )
@@ -32,6 +32,18 @@ def test_examples(example):
     )
 
 
+def test_multi_agent_parallel_example():
+    from examples import multi_agent
+
+    multi_agent.main(
+        scenarios=["scenarios/sumo/loop"],
+        headless=True,
+        num_episodes=1,
+        max_episode_steps=100,
+        num_env=2,
+    )
+
+
 def test_ray_multi_instance_example():
     from examples import ray_multi_instance
 
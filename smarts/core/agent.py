@@ -57,6 +57,13 @@ class Agent:
 
         raise NotImplementedError
 
+    def reset(self):
+        """Resets any per-episode state of the agent. Called at the start of
+        each episode when an agent is reused across episodes. Does nothing by
+        default.
+        """
+        pass
+
 
 def deprecated_agent_spec(*args, **kwargs):
     """Deprecated version of AgentSpec, see smarts.zoo.agent_spec"""
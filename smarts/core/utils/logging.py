@@ -18,6 +18,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 import ctypes
+import logging
 import os
 import sys
 from contextlib import contextmanager
@@ -28,12 +29,17 @@ from time import time
 @contextmanager
 def timeit(name: str, logger):
     """Context manger that stopwatches the amount of time between context block start and end.
+    The stopwatch is skipped if the logger is not enabled for `INFO` messages.
     ```python
     import logging
-    with timeit(n,logging):
+    with timeit(n,logging.getLogger(__name__)):
         a = a * b
     ```
     """
+    if not logger.isEnabledFor(logging.INFO):
+        yield
+        return
+
     start = time()
     yield
     elapsed_time = (time() - start) * 1000
@@ -244,16 +244,14 @@ class HiWayEnv(gym.Env):
         with timeit("SMARTS Simulation/Scenario Step", self._log):
             observations, rewards, dones, extras = self._smarts.step(agent_actions)
 
-        infos = {
-            agent_id: {"score": value, "env_obs": observations[agent_id]}
-            for agent_id, value in extras["scores"].items()
-        }
-
-        for agent_id in observations:
+        # Scores are reported for exactly the agents that are observed, so the
+        # infos are built in the same pass that applies the adapters.
+        scores = extras["scores"]
+        infos = {}
+        for agent_id, observation in observations.items():
             agent_spec = self._agent_specs[agent_id]
-            observation = observations[agent_id]
             reward = rewards[agent_id]
-            info = infos[agent_id]
+            info = {"score": scores[agent_id], "env_obs": observation}
 
             rewards[agent_id] = agent_spec.reward_adapter(observation, reward)
             observations[agent_id] = agent_spec.observation_adapter(observation)
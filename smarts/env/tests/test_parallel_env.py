@@ -113,6 +113,20 @@ def test_seed(env_constructor, num_env):
     env.close()
 
 
+@pytest.mark.parametrize("num_env", [2])
+def test_get_attr(env_constructor, num_env):
+    env = _make_parallel_env(env_constructor, num_env)
+    env.reset()
+
+    scenario_logs = env.get_attr("scenario_log")
+    assert len(scenario_logs) == num_env
+    for scenario_log in scenario_logs:
+        assert scenario_log["fixed_timestep_sec"] == 0.1
+        assert scenario_log["scenario_map"] == "figure_eight"
+
+    env.close()
+
+
 def _compare_observations(num_env, batched_observations, single_observations):
     assert len(batched_observations) == num_env
     for observations in batched_observations:
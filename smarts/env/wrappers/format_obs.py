@@ -255,6 +255,13 @@ class FormatObs(gym.ObservationWrapper):
         }
         self._accelerometer = "accelerometer" in intrfcs.keys()
 
+        # Resolve the formatting function and source attribute of each
+        # observation once, rather than on every step.
+        self._formatters = [
+            (stdob, globals()[f"_std_{stdob}"], self._stdob_to_ob[stdob])
+            for stdob in self._space.keys()
+        ]
+
     def _cmp_intrfc(self, intrfc: str, val: Any):
         assert all(
             getattr(self.agent_specs[agent_id].interface, intrfc) == val
@@ -271,19 +278,15 @@ class FormatObs(gym.ObservationWrapper):
         wrapped_obs = {}
         for agent_id, agent_obs in obs.items():
             wrapped_ob = {}
-            for stdob in self._space.keys():
-                func = globals()[f"_std_{stdob}"]
+            for stdob, func, ob in self._formatters:
                 if stdob == "ttc":
                     val = func(agent_obs)
                 elif stdob == "ego":
-                    val = func(
-                        getattr(agent_obs, self._stdob_to_ob[stdob]),
-                        self._accelerometer,
-                    )
+                    val = func(getattr(agent_obs, ob), self._accelerometer)
                 else:
-                    val = func(getattr(agent_obs, self._stdob_to_ob[stdob]))
-                wrapped_ob.update({stdob: val})
-            wrapped_obs.update({agent_id: wrapped_ob})
+                    val = func(getattr(agent_obs, ob))
+                wrapped_ob[stdob] = val
+            wrapped_obs[agent_id] = wrapped_ob
 
         return wrapped_obs
 
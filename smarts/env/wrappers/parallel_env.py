@@ -187,6 +187,18 @@ class ParallelEnv(object):
 
         return observation_space, action_space
 
+    def get_attr(self, name: str) -> Sequence[Any]:
+        """Retrieves an attribute from each environment.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            Sequence[Any]: Value of the attribute in each environment. None, if
+            the attribute is absent in an environment.
+        """
+        return self._call(_Message.ACCESS, [name] * self._num_envs)
+
     def seed(self, seed: int) -> Sequence[int]:
         """Sets unique seed for each environment.
 